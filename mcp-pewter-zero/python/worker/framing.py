@@ -0,0 +1,67 @@
+# Length-prefixed framing shared with src/adapters/pythonWorker.ts
+#
+# Every frame is a 4-byte big-endian unsigned length followed by that many
+# bytes of UTF-8 JSON. Frame kinds:
+#   { type: 'call', fn, payload }         request (node -> python)
+#   { type: 'chunk', seq, data }          slice of the serialized result
+#   { type: 'end', chunks }               result complete
+#   { type: 'error', error: {...} }       structured worker failure
+import json
+import struct
+import traceback
+
+HEADER = struct.Struct('>I')
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+CHUNK_CHARS = 64 * 1024
+
+
+class FrameError(Exception):
+    pass
+
+
+def _read_exact(stream, n):
+    buf = b''
+    while len(buf) < n:
+        part = stream.read(n - len(buf))
+        if not part:
+            return None
+        buf += part
+    return buf
+
+
+def read_frame(stream):
+    header = _read_exact(stream, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise FrameError(f'frame of {length} bytes exceeds limit of {MAX_FRAME_BYTES}')
+    body = _read_exact(stream, length)
+    if body is None:
+        raise FrameError('stream closed mid-frame')
+    return json.loads(body.decode('utf-8'))
+
+
+def write_frame(stream, msg):
+    body = json.dumps(msg).encode('utf-8')
+    # Blocking writes on the pipe give us backpressure from the node reader
+    stream.write(HEADER.pack(len(body)))
+    stream.write(body)
+    stream.flush()
+
+
+def write_result(stream, result):
+    text = json.dumps(result)
+    count = 0
+    for i in range(0, len(text), CHUNK_CHARS):
+        write_frame(stream, { 'type': 'chunk', 'seq': count, 'data': text[i:i + CHUNK_CHARS] })
+        count += 1
+    write_frame(stream, { 'type': 'end', 'chunks': count })
+
+
+def write_error(stream, exc):
+    write_frame(stream, { 'type': 'error', 'error': {
+        'name': type(exc).__name__,
+        'message': str(exc),
+        'traceback': traceback.format_exc(),
+    } })
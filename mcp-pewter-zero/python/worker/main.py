@@ -1,34 +1,38 @@
-import sys, json
+import sys
+from framing import read_frame, write_result, write_error
 from models.bass_diffusion import run_bass, sweep_bass, sensitivity_bass
 
 # In future: route to PySD if kind == 'xmile'
 
-def main():
-    line = sys.stdin.readline()
-    call = json.loads(line)
-    fn = call.get('fn')
-    payload = call.get('payload')
-
+def dispatch(fn, payload):
     if fn == 'run_model':
         spec = payload['spec']
         params = payload['params']
         if spec['kind'] == 'python' and 'bass_diffusion' in spec['entry']:
-            out = run_bass(spec, params)
-            print(json.dumps(out))
-            return
+            return run_bass(spec, params)
         raise NotImplementedError('run_model for spec kind')
 
     if fn == 'sweep':
-        out = sweep_bass(payload['spec'], payload['grid'], payload.get('budget'))
-        print(json.dumps(out))
-        return
+        return sweep_bass(payload['spec'], payload['grid'], payload.get('budget'),
+                          payload.get('strategy', 'grid'), payload.get('time_budget_s'), payload.get('seed'))
 
     if fn == 'sensitivity':
-        out = sensitivity_bass(payload['spec'], payload['baseline'], payload.get('method','one_at_a_time'))
-        print(json.dumps(out))
-        return
+        return sensitivity_bass(payload['spec'], payload['baseline'], payload.get('method','one_at_a_time'))
 
-    raise ValueError('unknown fn')
+    raise ValueError(f'unknown fn: {fn}')
+
+def main():
+    out = sys.stdout.buffer
+    try:
+        call = read_frame(sys.stdin.buffer)
+        if call is None or call.get('type') != 'call':
+            raise ValueError('expected a call frame on stdin')
+        result = dispatch(call.get('fn'), call.get('payload'))
+    except Exception as exc:
+        write_error(out, exc)
+        return 1
+    write_result(out, result)
+    return 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
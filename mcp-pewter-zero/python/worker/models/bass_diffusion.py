@@ -1,6 +1,10 @@
 # Minimal Bass diffusion model (pure Python fallback)
 # dA/dt = p*(M - A) + q*(A/M)*(M - A)
 # where A is adopters, M market size, p innovation, q imitation
+import itertools
+import random
+
+from sampling import SweepBudget, latin_hypercube, sobol, refine, coverage_stats
 
 def simulate_bass(p, q, M, dt, t_end):
     steps = int(t_end / dt)
@@ -25,22 +29,68 @@ def run_bass(spec, params):
     return { 'series': series, 'metrics': { 'final_A': series['y']['A'][-1] } }
 
 
-def sweep_bass(spec, grid, budget=None):
+SWEEP_PARAMS = ('p', 'q', 'M')
+SWEEP_DEFAULTS = { 'p': [0.01], 'q': [0.1], 'M': [1000] }
+
+
+def sweep_bass(spec, grid, budget=None, strategy='grid', time_budget_s=None, seed=None):
+    # strategy: 'grid' walks the full factorial in order; 'lhs', 'sobol' and
+    # 'refine' sample the box [min, max] of each grid axis instead.
     dt = float(spec['dt']); t_end = float(spec['t_end'])
-    values_p = grid.get('p', [0.01])
-    values_q = grid.get('q', [0.1])
-    values_M = grid.get('M', [1000])
+    values = { k: grid.get(k, SWEEP_DEFAULTS[k]) for k in SWEEP_PARAMS }
+    bounds = { k: (float(min(values[k])), float(max(values[k]))) for k in SWEEP_PARAMS }
+    active = [k for k in SWEEP_PARAMS if bounds[k][1] > bounds[k][0]]
+    full_factorial = 1
+    for k in SWEEP_PARAMS:
+        full_factorial *= len(values[k])
+    clock = SweepBudget(budget, time_budget_s)
+    rng = random.Random(seed)
     runs = []
-    count = 0
-    for p in values_p:
-        for q in values_q:
-            for M in values_M:
-                if budget is not None and count >= budget:
-                    break
-                series = simulate_bass(float(p), float(q), float(M), dt, t_end)
-                runs.append({ 'params': { 'p': p, 'q': q, 'M': M }, 'series': series })
-                count += 1
-    return { 'runs': runs }
+
+    def evaluate(params):
+        series = simulate_bass(float(params['p']), float(params['q']), float(params['M']), dt, t_end)
+        score = series['y']['A'][-1]
+        runs.append({ 'params': params, 'series': series, 'score': score })
+        return score
+
+    def evaluate_unit(u):
+        params = { k: bounds[k][0] for k in SWEEP_PARAMS }
+        for k, x in zip(active, u):
+            lo, hi = bounds[k]
+            params[k] = lo + x * (hi - lo)
+        return evaluate(params)
+
+    # Sampled designs default to as many runs as the full factorial would take
+    n = int(budget) if budget is not None else full_factorial
+    if not active:
+        n = min(n, 1)
+
+    if strategy == 'grid':
+        for combo in itertools.product(*(values[k] for k in SWEEP_PARAMS)):
+            if not clock.allows(len(runs)):
+                break
+            evaluate(dict(zip(SWEEP_PARAMS, combo)))
+    elif strategy in ('lhs', 'sobol'):
+        design = latin_hypercube(n, len(active), rng) if strategy == 'lhs' else sobol(n, len(active), rng if seed is not None else None)
+        for u in design:
+            if not clock.allows(len(runs)):
+                break
+            evaluate_unit(u)
+    elif strategy == 'refine':
+        refine(evaluate_unit, n, len(active), clock, rng)
+    else:
+        raise ValueError(f'unknown sweep strategy: {strategy}')
+
+    coverage = {
+        'strategy': strategy,
+        'runs': len(runs),
+        'full_factorial': full_factorial,
+        'fraction_of_full_factorial': len(runs) / full_factorial,
+        'elapsed_s': clock.elapsed(),
+        'stopped_by': clock.stopped_by or 'complete',
+        'params': coverage_stats(runs, bounds),
+    }
+    return { 'runs': runs, 'coverage': coverage }
 
 
 def sensitivity_bass(spec, baseline, method='one_at_a_time'):
@@ -0,0 +1,143 @@
+# Sweep designs over the unit hypercube (pure Python, no numpy needed)
+#
+# Strategies return points u in [0, 1)^d; callers map them onto parameter
+# ranges. Budgets are checked before each run, so no run starts once the run
+# count or wall-clock budget is spent.
+import math
+import time
+
+# Joe & Kuo (2008) direction numbers for Sobol dimensions 2..8 as (s, a, m_1..m_s);
+# dimension 1 is the van der Corput sequence.
+SOBOL_DIRECTIONS = [
+    (1, 0, [1]),
+    (2, 1, [1, 3]),
+    (3, 1, [1, 3, 1]),
+    (3, 2, [1, 1, 1]),
+    (4, 1, [1, 1, 3, 3]),
+    (4, 4, [1, 3, 5, 13]),
+    (5, 2, [1, 1, 5, 5, 17]),
+]
+SOBOL_BITS = 32
+
+
+class SweepBudget:
+    def __init__(self, runs=None, seconds=None):
+        self.runs = runs
+        self.seconds = seconds
+        self.start = time.monotonic()
+        self.stopped_by = None
+
+    def allows(self, count):
+        if self.runs is not None and count >= self.runs:
+            self.stopped_by = 'budget'
+            return False
+        if self.seconds is not None and self.elapsed() >= self.seconds:
+            self.stopped_by = 'time'
+            return False
+        return True
+
+    def elapsed(self):
+        return time.monotonic() - self.start
+
+
+def latin_hypercube(n, d, rng):
+    # One point per stratum along every axis, strata paired by random permutation
+    columns = []
+    for _ in range(d):
+        perm = list(range(n))
+        rng.shuffle(perm)
+        columns.append([(k + rng.random()) / n for k in perm])
+    return [[columns[j][i] for j in range(d)] for i in range(n)]
+
+
+def _sobol_vectors(d):
+    if d > len(SOBOL_DIRECTIONS) + 1:
+        raise ValueError(f'sobol supports at most {len(SOBOL_DIRECTIONS) + 1} dimensions, got {d}')
+    vectors = [[1 << (SOBOL_BITS - i) for i in range(1, SOBOL_BITS + 1)]]
+    for s, a, m in SOBOL_DIRECTIONS[:d - 1]:
+        v = [0] * (SOBOL_BITS + 1)
+        for i in range(1, SOBOL_BITS + 1):
+            if i <= s:
+                v[i] = m[i - 1] << (SOBOL_BITS - i)
+            else:
+                v[i] = v[i - s] ^ (v[i - s] >> s)
+                for k in range(1, s):
+                    if (a >> (s - 1 - k)) & 1:
+                        v[i] ^= v[i - k]
+        vectors.append(v[1:])
+    return vectors
+
+
+def sobol(n, d, rng=None):
+    # Gray-code construction; an optional random digital shift keeps the
+    # net structure while decorrelating repeated sweeps with different seeds.
+    vectors = _sobol_vectors(d)
+    shift = [rng.getrandbits(SOBOL_BITS) if rng else 0 for _ in range(d)]
+    x = [0] * d
+    scale = float(1 << SOBOL_BITS)
+    points = []
+    for i in range(n):
+        if i > 0:
+            c = ((i - 1) ^ i).bit_length() - 1  # rightmost zero bit of i - 1
+            for j in range(d):
+                x[j] ^= vectors[j][c]
+        points.append([(x[j] ^ shift[j]) / scale for j in range(d)])
+    return points
+
+
+def _dist(u, v):
+    return math.sqrt(sum((a - b) ** 2 for a, b in zip(u, v)))
+
+
+def refine(evaluate, n, d, budget, rng, min_dist=1e-3):
+    # Successive refinement: seed with a coarse LHS, then repeatedly bisect
+    # the nearest-neighbour pair whose outputs differ the most.
+    pts, ys, nn = [], [], []
+
+    def add(u):
+        y = evaluate(u)
+        best = (math.inf, -1)
+        for i, v in enumerate(pts):
+            dist = _dist(u, v)
+            if dist < best[0]:
+                best = (dist, i)
+            if dist < nn[i][0]:
+                nn[i] = (dist, len(pts))
+        pts.append(u); ys.append(y); nn.append(best)
+
+    for u in latin_hypercube(min(n, max(d + 1, n // 4)), d, rng):
+        if not budget.allows(len(pts)):
+            return
+        add(u)
+
+    while len(pts) < n and budget.allows(len(pts)):
+        best = None
+        for i, (dist, j) in enumerate(nn):
+            if j < 0 or dist < min_dist:
+                continue
+            gap = abs(ys[i] - ys[j])
+            if best is None or gap > best[0]:
+                best = (gap, i, j)
+        if best is None:
+            return
+        _, i, j = best
+        add([(a + b) / 2 for a, b in zip(pts[i], pts[j])])
+
+
+def coverage_stats(runs, bounds):
+    # Per-parameter spread plus 1-D projection coverage: the fraction of
+    # len(runs) equal-width bins over [lo, hi] that hold at least one run.
+    stats = {}
+    for k, (lo, hi) in bounds.items():
+        vals = [r['params'][k] for r in runs]
+        if not vals:
+            stats[k] = { 'lo': lo, 'hi': hi, 'distinct': 0, 'bin_coverage': 0.0 }
+            continue
+        if hi > lo:
+            bins = {min(int((v - lo) / (hi - lo) * len(vals)), len(vals) - 1) for v in vals}
+            bin_coverage = len(bins) / len(vals)
+        else:
+            bin_coverage = 1.0
+        stats[k] = { 'lo': lo, 'hi': hi, 'min': min(vals), 'max': max(vals),
+                     'distinct': len(set(vals)), 'bin_coverage': bin_coverage }
+    return stats
@@ -1,20 +1,115 @@
 import { spawn } from 'node:child_process';
-import { once } from 'node:events';
+import type { Writable } from 'node:stream';
 
 export interface PyCall {
   fn: 'run_model' | 'sweep' | 'sensitivity';
   payload: any;
 }
 
+// Wire format shared with python/worker/framing.py: a 4-byte big-endian
+// length followed by that many bytes of UTF-8 JSON.
+export type Frame =
+  | { type: 'call'; fn: PyCall['fn']; payload: any }
+  | { type: 'chunk'; seq: number; data: string }
+  | { type: 'end'; chunks: number }
+  | { type: 'error'; error: PyErrorInfo };
+
+export interface PyErrorInfo {
+  name: string;
+  message: string;
+  traceback?: string;
+}
+
+export const HEADER_BYTES = 4;
+export const MAX_FRAME_BYTES = 64 * 1024 * 1024;
+
+export class PythonWorkerError extends Error {
+  pyName: string;
+  traceback?: string;
+  constructor(info: PyErrorInfo) {
+    super(`${info.name}: ${info.message}`);
+    this.name = 'PythonWorkerError';
+    this.pyName = info.name;
+    this.traceback = info.traceback;
+  }
+}
+
+export function encodeFrame(msg: Frame): Buffer {
+  const body = Buffer.from(JSON.stringify(msg), 'utf-8');
+  const header = Buffer.alloc(HEADER_BYTES);
+  header.writeUInt32BE(body.length, 0);
+  return Buffer.concat([header, body]);
+}
+
+export class FrameDecoder {
+  private buf: Buffer = Buffer.alloc(0);
+
+  push(chunk: Buffer): Frame[] {
+    this.buf = this.buf.length ? Buffer.concat([this.buf, chunk]) : chunk;
+    const frames: Frame[] = [];
+    while (this.buf.length >= HEADER_BYTES) {
+      const length = this.buf.readUInt32BE(0);
+      if (length > MAX_FRAME_BYTES) {
+        throw new Error(`Frame of ${length} bytes exceeds limit of ${MAX_FRAME_BYTES}`);
+      }
+      if (this.buf.length < HEADER_BYTES + length) break;
+      const body = this.buf.subarray(HEADER_BYTES, HEADER_BYTES + length).toString('utf-8');
+      this.buf = this.buf.subarray(HEADER_BYTES + length);
+      try { frames.push(JSON.parse(body)); } catch (e) { throw new Error('Invalid frame from python: ' + body.slice(0, 200)); }
+    }
+    return frames;
+  }
+
+  get pending(): number {
+    return this.buf.length;
+  }
+}
+
+async function writeFrame(stream: Writable, msg: Frame): Promise<void> {
+  if (stream.write(encodeFrame(msg))) return;
+  // Wait for the pipe to drain, or stop waiting if it closes first (python exited)
+  await new Promise<void>((resolve) => { stream.once('drain', resolve); stream.once('close', resolve); });
+}
+
 function getPythonCmd(): string {
   return process.env.PYTHON || 'python3';
 }
 
 export async function callPythonWorker(call: PyCall): Promise<any> {
   const child = spawn(getPythonCmd(), ['-u', 'python/worker/main.py'], { stdio: ['pipe', 'pipe', 'inherit'] });
-  child.stdin.write(JSON.stringify(call) + '\n');
+  // Spawn failures (e.g. missing interpreter) tear down both pipes; python
+  // reports its own failures as error frames, so a broken stdin pipe adds nothing.
+  let spawnError: Error | undefined;
+  child.on('error', (err) => { spawnError = err; child.stdin.destroy(); child.stdout.destroy(); });
+  child.stdin.on('error', () => {});
+  const closed = new Promise<number | null>((resolve) => child.on('close', resolve));
+
+  await writeFrame(child.stdin, { type: 'call', ...call });
   child.stdin.end();
-  const [stdout] = await once(child.stdout, 'data');
-  const text = stdout.toString('utf-8').trim();
-  try { return JSON.parse(text); } catch (e) { throw new Error('Invalid JSON from python: ' + text); }
-}
\ No newline at end of file
+
+  const decoder = new FrameDecoder();
+  const parts: string[] = [];
+  // Async iteration only pulls the next chunk once we've consumed the last,
+  // so a slow consumer pauses the pipe and python blocks on write.
+  try {
+    for await (const chunk of child.stdout) {
+      for (const frame of decoder.push(chunk as Buffer)) {
+        if (frame.type === 'chunk') {
+          if (frame.seq !== parts.length) throw new Error(`Out-of-order chunk from python: ${frame.seq}`);
+          parts.push(frame.data);
+        } else if (frame.type === 'end') {
+          if (frame.chunks !== parts.length) throw new Error(`Expected ${frame.chunks} chunks from python, got ${parts.length}`);
+          return JSON.parse(parts.join(''));
+        } else if (frame.type === 'error') {
+          throw new PythonWorkerError(frame.error);
+        }
+      }
+    }
+  } catch (err) {
+    throw spawnError ?? err;
+  }
+
+  if (spawnError) throw spawnError;
+  const code = await closed;
+  throw new Error(`Python worker exited (code ${code}) without a result frame` + (decoder.pending ? `; ${decoder.pending} bytes left unparsed` : ''));
+}
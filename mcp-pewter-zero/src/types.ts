@@ -19,14 +19,28 @@ export interface RunModelInput {
 }
 export interface RunModelOutput { series: Series; metrics?: Record<string, number>; }
 
+export type SweepStrategy = 'grid' | 'lhs' | 'sobol' | 'refine';
+
 export interface SweepInput {
   spec: ModelSpec;
   grid: Record<string, number[]>;
   budget?: number;
+  strategy?: SweepStrategy;
+  time_budget_s?: number;
   seed?: number;
 }
+export interface SweepCoverage {
+  strategy: SweepStrategy;
+  runs: number;
+  full_factorial: number;
+  fraction_of_full_factorial: number;
+  elapsed_s: number;
+  stopped_by: 'complete' | 'budget' | 'time';
+  params: Record<string, { lo: number; hi: number; min?: number; max?: number; distinct: number; bin_coverage: number }>;
+}
 export interface SweepOutput {
   runs: Array<{ params: ParamSpec; series: Series; score?: number }>;
+  coverage?: SweepCoverage;
 }
 
 export interface SensitivityInput {
@@ -0,0 +1,32 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { callPythonWorker, FrameDecoder, PythonWorkerError, encodeFrame } from '../../src/adapters/pythonWorker.ts';
+
+test('T06: Framed worker protocol carries payloads larger than one pipe chunk', async () => {
+  const out = await callPythonWorker({ fn: 'sweep', payload: {
+    spec: { kind: 'python', entry: 'python.models.bass_diffusion:model', variables: ['A'], dt: 0.01, t_end: 50 },
+    grid: { p: [0.02,0.03], q: [0.3,0.4], M: [10000] }
+  }});
+  assert.ok(JSON.stringify(out).length > 64 * 1024);
+  assert.equal(out.runs.length, 4);
+  assert.equal(out.runs[0].series.t.length, 5001);
+});
+
+test('T06: Worker failures come back as structured error frames', async () => {
+  await assert.rejects(
+    callPythonWorker({ fn: 'bogus' as any, payload: {} }),
+    (err: any) => err instanceof PythonWorkerError && err.pyName === 'ValueError' && /unknown fn/.test(err.message) && !!err.traceback
+  );
+});
+
+test('T06: FrameDecoder reassembles frames split across reads', () => {
+  const bytes = Buffer.concat([
+    encodeFrame({ type: 'chunk', seq: 0, data: 'x'.repeat(1000) }),
+    encodeFrame({ type: 'end', chunks: 1 })
+  ]);
+  const decoder = new FrameDecoder();
+  const frames = [];
+  for (let i = 0; i < bytes.length; i += 7) frames.push(...decoder.push(bytes.subarray(i, i + 7)));
+  assert.deepEqual(frames.map((f) => f.type), ['chunk', 'end']);
+  assert.equal(decoder.pending, 0);
+});
@@ -0,0 +1,32 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import { callPythonWorker } from '../../src/adapters/pythonWorker.ts';
+
+const spec = { kind: 'python', entry: 'python.models.bass_diffusion:model', variables: ['A'], dt: 0.5, t_end: 50 };
+const grid = { p: [0.015,0.03,0.045], q: [0.19,0.38,0.57], M: [10000] };
+
+test('T07: Sampled sweeps respect the run budget and spread over the grid box', async () => {
+  for (const strategy of ['lhs', 'sobol', 'refine']) {
+    const out = await callPythonWorker({ fn: 'sweep', payload: { spec, grid, budget: 5, strategy, seed: 7 } });
+    assert.equal(out.runs.length, 5);
+    assert.equal(out.coverage.strategy, strategy);
+    assert.equal(out.coverage.full_factorial, 9);
+    for (const run of out.runs) {
+      assert.ok(run.params.p >= 0.015 && run.params.p <= 0.045);
+      assert.ok(run.params.q >= 0.19 && run.params.q <= 0.57);
+      assert.equal(run.params.M, 10000);
+    }
+  }
+});
+
+test('T07: LHS covers every stratum of each swept axis', async () => {
+  const out = await callPythonWorker({ fn: 'sweep', payload: { spec, grid, budget: 6, strategy: 'lhs', seed: 1 } });
+  assert.equal(out.coverage.params.p.bin_coverage, 1);
+  assert.equal(out.coverage.params.q.bin_coverage, 1);
+});
+
+test('T07: Grid sweep reports when the budget cut it short', async () => {
+  const out = await callPythonWorker({ fn: 'sweep', payload: { spec, grid, budget: 4 } });
+  assert.equal(out.runs.length, 4);
+  assert.equal(out.coverage.stopped_by, 'budget');
+});
@@ -10,4 +10,9 @@ def get_store_dir() -> Path:
     return Path(path)
 
 
+def get_cache_max_bytes() -> int:
+    return int(os.environ.get("SYSLAB_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
 STORE_ROOT = get_store_dir()
+CACHE_MAX_BYTES = get_cache_max_bytes()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+
+def content_etag(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    data: bytes
+    etag: str
+    mtime_ns: int
+
+
+class ByteCache:
+    """In-process LRU of artifact bytes, bounded by total size rather than entry count."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[Path, CacheEntry] = OrderedDict()
+
+    def get(self, path: Path, mtime_ns: int, size: int) -> CacheEntry | None:
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        # Drop entries whose file changed underneath us (e.g. another process wrote it)
+        if entry.mtime_ns != mtime_ns or len(entry.data) != size:
+            self.invalidate(path)
+            return None
+        self._entries.move_to_end(path)
+        return entry
+
+    def put(self, path: Path, data: bytes, mtime_ns: int) -> CacheEntry:
+        self.invalidate(path)
+        entry = CacheEntry(data=data, etag=content_etag(data), mtime_ns=mtime_ns)
+        if len(data) > self.max_bytes:
+            return entry
+        self._entries[path] = entry
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted.data)
+        return entry
+
+    def invalidate(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.size -= len(entry.data)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
@@ -3,14 +3,16 @@ import json
 from pathlib import Path
 from typing import Any
 
-from .uris import parse_syslab_uri
+from .cache import ByteCache, CacheEntry
+from .uris import make_syslab_uri, parse_syslab_uri
 
 
 class Store:
     """Simple file-backed store for systems-lab artifacts."""
 
-    def __init__(self, root: Path):
+    def __init__(self, root: Path, cache_max_bytes: int = 64 * 1024 * 1024):
         self.root = Path(root)
+        self.cache = ByteCache(cache_max_bytes)
         self.kinds = {
             "runs": self.root / "runs",
             "opt": self.root / "opt",
@@ -24,12 +26,18 @@ class Store:
 
     # ------------------------------------------------------------------
     # Path helpers
-    def _path_from_uri(self, uri: str) -> Path:
-        kind, rel = parse_syslab_uri(uri)
+    def _resolve(self, kind: str, rel: str) -> Path:
         base = self.kinds.get(kind)
         if base is None:
             raise ValueError(f"Unknown kind: {kind}")
-        return base / rel
+        path = base / rel
+        if not path.resolve().is_relative_to(base.resolve()):
+            raise ValueError(f"Path escapes {kind} store: {rel}")
+        return path
+
+    def _path_from_uri(self, uri: str) -> Path:
+        kind, rel = parse_syslab_uri(uri)
+        return self._resolve(kind, rel)
 
     # ------------------------------------------------------------------
     # Read / write
@@ -38,6 +46,7 @@ class Store:
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        self.cache.invalidate(path)
         return uri
 
     def write_bytes(self, uri: str, data: bytes) -> str:
@@ -45,11 +54,42 @@ class Store:
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("wb") as f:
             f.write(data)
+        self.cache.invalidate(path)
         return uri
 
+    def _load(self, kind: str, rel: str) -> CacheEntry:
+        path = self._resolve(kind, rel)
+        st = path.stat()
+        entry = self.cache.get(path, st.st_mtime_ns, st.st_size)
+        if entry is None:
+            entry = self.cache.put(path, path.read_bytes(), st.st_mtime_ns)
+        return entry
+
     def read_bytes(self, kind: str, rel: str) -> bytes:
-        path = self.kinds[kind] / rel
-        return path.read_bytes()
+        return self._load(kind, rel).data
+
+    def read_conditional(
+        self,
+        kind: str,
+        rel: str,
+        if_none_match: str | None = None,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> tuple[bytes | None, dict[str, Any]]:
+        """Read an artifact, HTTP style.
+
+        Returns ``(None, meta)`` when ``if_none_match`` equals the current ETag,
+        otherwise the bytes in ``[offset, offset + length)`` (to the end when
+        ``length`` is None) alongside the metadata for the whole artifact.
+        """
+        entry = self._load(kind, rel)
+        meta = {"uri": make_syslab_uri(kind, rel), "etag": entry.etag, "size": len(entry.data)}
+        if if_none_match is not None and if_none_match.strip('"') == entry.etag:
+            return None, meta
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError("offset and length must be non-negative")
+        end = len(entry.data) if length is None else offset + length
+        return entry.data[offset:end], meta
 
     # ------------------------------------------------------------------
     def catalog(self) -> dict[str, list[str]]:
@@ -7,12 +7,8 @@ def parse_syslab_uri(uri: str) -> tuple[str, str]:
     parsed = urlparse(uri)
     if parsed.scheme != "syslab":
         raise ValueError(f"Unsupported URI scheme: {parsed.scheme}")
-    path = parsed.path.lstrip("/")
-    if "/" in path:
-        kind, rel = path.split("/", 1)
-    else:
-        kind, rel = path, ""
-    return kind, rel
+    # syslab://<kind>/<rel> puts the kind in the authority slot
+    return parsed.netloc, parsed.path.lstrip("/")
 
 
 def make_syslab_uri(kind: str, *parts: str) -> str:
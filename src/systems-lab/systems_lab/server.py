@@ -1,10 +1,12 @@
 from __future__ import annotations
+import base64
 import json
 
 from fastmcp import FastMCP
 
-from .config import STORE_ROOT
+from .config import STORE_ROOT, CACHE_MAX_BYTES
 from .resources.store import Store
+from .resources.uris import parse_syslab_uri
 from .prompts.or_sequential_playbook import SUMMARY as OR_SUMMARY, BODY as OR_BODY
 from .prompts.sd_sequential_playbook import SUMMARY as SD_SUMMARY, BODY as SD_BODY
 from .sd.run_simulation import run_simulation
@@ -14,7 +16,7 @@ from importlib import import_module
 # `or` is a reserved keyword; import via importlib
 optimize_policy_seq = import_module('.or.optimize_policy_seq', __package__).optimize_policy_seq
 
-store = Store(STORE_ROOT)
+store = Store(STORE_ROOT, cache_max_bytes=CACHE_MAX_BYTES)
 store.ensure()
 
 server = FastMCP(name="systems_lab", version="1.1")
@@ -34,6 +36,36 @@ async def dynamic_read(kind: str, path: str) -> bytes:
 
 # ---------------------------------------------------------------------------
 # Tools
+@server.tool(
+    "store.read_artifact",
+    description="Conditional / ranged read of a syslab:// artifact (skip unchanged content via ETag)",
+    output_schema={
+        "type": "object",
+        "properties": {
+            "uri": {"type": "string", "format": "uri"},
+            "etag": {"type": "string"},
+            "size": {"type": "integer"},
+            "notModified": {"type": "boolean"},
+            "offset": {"type": "integer"},
+            "encoding": {"type": "string", "enum": ["utf-8", "base64"]},
+            "data": {"type": "string"},
+        },
+        "required": ["uri", "etag", "size", "notModified"],
+    },
+)
+async def store_read_artifact(uri: str, if_none_match: str | None = None, offset: int = 0, length: int | None = None):
+    kind, rel = parse_syslab_uri(uri)
+    data, meta = store.read_conditional(kind, rel, if_none_match=if_none_match, offset=offset, length=length)
+    if data is None:
+        return {**meta, "notModified": True}
+    try:
+        encoding, text = "utf-8", data.decode("utf-8")
+    except UnicodeDecodeError:
+        # Range boundaries can split multi-byte characters; fall back to base64
+        encoding, text = "base64", base64.b64encode(data).decode("ascii")
+    return {**meta, "notModified": False, "offset": offset, "encoding": encoding, "data": text}
+
+
 @server.tool(
     "sd.run_simulation",
     description="Run Simulation (Toy Logistic Growth)",